@@ -10,9 +10,9 @@ df = news.load_news_data()
 filtered_df = news.filter_news_by_company(df, "Walmart")
 dict_companies = news.get_company_dict(df)
 dict_topics = news.get_topic_dict(filtered_df)
-news_title, news_date_published, news_text, news_link = news.get_news_elements(filtered_df, 0)
+news_title, news_date_published, news_text, news_link, news_summary = news.get_news_elements(filtered_df, 0)
 header = f"# {news_title}\n"
-abstract = "> Abstract summary"
+abstract = f"> {news_summary}\n\n" if news_summary else ""
 date_published = f"*{news_date_published}*\n\n"
 text = f"{news_text}\n\n"
 link = f"{news_link}\n"
@@ -1,5 +1,6 @@
 import polars as pl
-from typing import List, Dict
+from datetime import date
+from typing import List, Dict, Tuple
 
 def load_news_data(file_path: str = "./Data/News/news_with_topics.parquet") -> pl.DataFrame:
     """
@@ -60,16 +61,17 @@ def get_company_dict(df: pl.DataFrame) -> List[Dict[str, str]]:
     unique_companies = df.select("companies").unique().sort("companies")
     return [{"label": row[0], "value": row[0]} for row in unique_companies.rows()]
 
-def get_news_elements(df: pl.DataFrame, index: int) -> str:
+def get_news_elements(df: pl.DataFrame, index: int) -> Tuple[str, date, str, str, str]:
     """
-    Get the text of a news article at a specific index, with newlines formatted.
+    Get the elements of a news article at a specific index, with newlines formatted.
 
     Args:
         df (pl.DataFrame): The news data.
         index (int): The index of the news article.
 
     Returns:
-        str: The formatted text of the news article.
+        Tuple[str, date, str, str, str]: The title, publication date, formatted text, link and extractive summary of the news article.
+        The summary is empty if the summaries stage has not been run yet.
     """
     news = (
         df
@@ -81,6 +83,7 @@ def get_news_elements(df: pl.DataFrame, index: int) -> str:
     news_date_published = news[0,"date_published"]
     news_text = news[0, "text"].replace(r"\n", "\n")
     news_link = news[0, "link"]
+    news_summary = news[0, "summary"] if "summary" in news.columns else None
 
-    return news_title, news_date_published, news_text, news_link
+    return news_title, news_date_published, news_text, news_link, news_summary or ""
 
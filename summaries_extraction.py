@@ -0,0 +1,187 @@
+from sentence_transformers import SentenceTransformer
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import torch
+import polars as pl
+import os
+import re
+import time
+from typing import List, Optional
+
+# Same embedding model as the topic stage, so the weights are already cached locally
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+
+# One model per process, loaded once before the first batch
+_embedding_model: Optional[SentenceTransformer] = None
+
+def _load_embedding_model() -> None:
+    """
+    Loads the sentence embedding model in the current process.
+    """
+    global _embedding_model
+    _embedding_model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+
+def _init_worker() -> None:
+    """
+    Loads the sentence embedding model once per worker process.
+    Each worker uses a single thread so the pool does not oversubscribe the CPUs.
+    """
+    torch.set_num_threads(1)
+    _load_embedding_model()
+
+def split_sentences(text: str, min_words: int = 5) -> List[str]:
+    """
+    Splits a news article into sentences.
+
+    Args:
+        text (str): The article text.
+        min_words (int): Sentences with fewer words are dropped (captions, bylines...).
+
+    Returns:
+        List[str]: The sentences of the article, in their original order.
+    """
+    sentences = re.split(r"(?<=[.!?])\s+|\n+", text or "")
+    return [s.strip() for s in sentences if len(s.split()) >= min_words]
+
+def textrank(embeddings: np.ndarray, damping: float = 0.85, max_iter: int = 100, tol: float = 1e-6) -> np.ndarray:
+    """
+    Scores sentences with TextRank over the cosine similarity graph of their embeddings.
+
+    Args:
+        embeddings (np.ndarray): The L2-normalized sentence embeddings, one row per sentence.
+        damping (float): The PageRank damping factor.
+        max_iter (int): The maximum number of power iterations.
+        tol (float): The convergence threshold on the L1 change of the scores.
+
+    Returns:
+        np.ndarray: The score of each sentence.
+    """
+    n = embeddings.shape[0]
+    similarity = np.clip(embeddings @ embeddings.T, 0, None)
+    np.fill_diagonal(similarity, 0)
+
+    # Sentences unrelated to all others spread their weight uniformly
+    row_sums = similarity.sum(axis=1, keepdims=True)
+    transition = np.where(row_sums > 0, similarity / np.where(row_sums > 0, row_sums, 1), 1 / n)
+
+    scores = np.full(n, 1 / n)
+    for _ in range(max_iter):
+        new_scores = (1 - damping) / n + damping * (transition.T @ scores)
+        if np.abs(new_scores - scores).sum() < tol:
+            return new_scores
+        scores = new_scores
+    return scores
+
+def summarize_batch(documents: List[str], nb_sentences: int = 3) -> List[str]:
+    """
+    Computes extractive summaries for a batch of documents.
+    All the sentences of the batch are embedded in a single call to the model.
+
+    Args:
+        documents (List[str]): The documents to summarize.
+        nb_sentences (int): The number of sentences kept in each summary.
+
+    Returns:
+        List[str]: The summary of each document.
+    """
+    documents_sentences = [split_sentences(document) for document in documents]
+    all_sentences = [sentence for sentences in documents_sentences for sentence in sentences]
+    if not all_sentences:
+        return ["" for _ in documents]
+
+    all_embeddings = _embedding_model.encode(all_sentences, batch_size=64, normalize_embeddings=True)
+
+    summaries = []
+    offset = 0
+    for sentences in documents_sentences:
+        embeddings = all_embeddings[offset:offset + len(sentences)]
+        offset += len(sentences)
+        if len(sentences) <= nb_sentences:
+            summaries.append(" ".join(sentences))
+            continue
+        top_indices = np.sort(np.argsort(textrank(embeddings))[-nb_sentences:])
+        summaries.append(" ".join(sentences[i] for i in top_indices))
+    return summaries
+
+def summarize_documents(documents: List[str], max_workers: Optional[int] = None, batch_size: int = 32) -> List[str]:
+    """
+    Computes extractive summaries for a list of documents across a process pool.
+    The pool is capped to the number of batches, and a single worker runs in-process
+    since a pool would only add a model load.
+
+    Args:
+        documents (List[str]): The documents to summarize.
+        max_workers (Optional[int]): The maximum number of worker processes (defaults to the number of CPUs).
+        batch_size (int): The number of documents sent to a worker at once.
+
+    Returns:
+        List[str]: The summary of each document, in the same order as the input.
+    """
+    if not documents:
+        return []
+
+    batches = [documents[i:i + batch_size] for i in range(0, len(documents), batch_size)]
+    max_workers = min(max_workers or os.cpu_count() or 1, len(batches))
+
+    if max_workers == 1:
+        _load_embedding_model()
+        return [summary for batch in batches for summary in summarize_batch(batch)]
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+        return [summary for summaries in executor.map(summarize_batch, batches) for summary in summaries]
+
+def load_cached_summaries(path: str) -> pl.DataFrame:
+    """
+    Loads the summaries computed by previous runs.
+
+    Args:
+        path (str): The path to the summaries Parquet file.
+
+    Returns:
+        pl.DataFrame: The cached summaries, keyed by article link.
+    """
+    if os.path.exists(path):
+        return pl.read_parquet(path)
+    return pl.DataFrame(schema={"link": pl.Utf8, "summary": pl.Utf8})
+
+def main():
+    # Run after topics_extraction.py, which rebuilds news_with_topics.parquet.
+    # Summaries are cached by link, so rerunning this stage only summarizes new articles.
+    news_path = "./Data/News/news_with_topics.parquet"
+    summaries_path = "./Data/News/news_summaries.parquet"
+
+    df_news = pl.read_parquet(news_path)
+    cached_summaries = load_cached_summaries(summaries_path)
+
+    # An article appears once per company it mentions, summarize it only once and only if it is new
+    new_articles = (
+        df_news
+        .select(["link", "text"])
+        .unique("link", maintain_order=True)
+        .join(cached_summaries, on="link", how="anti")
+    )
+
+    start = time.perf_counter()
+    summaries = summarize_documents(new_articles["text"].to_list())
+    elapsed = time.perf_counter() - start
+
+    all_summaries = pl.concat(
+        [cached_summaries, new_articles.select("link").with_columns(summary=pl.Series(summaries, dtype=pl.Utf8))],
+        how="vertical"
+    )
+    all_summaries.write_parquet(summaries_path)
+
+    (
+        df_news
+        .select(pl.exclude("summary"))
+        .join(all_summaries, on="link", how="left")
+        .write_parquet(news_path)
+    )
+
+    nb_skipped = df_news["link"].n_unique() - len(new_articles)
+    rate = len(summaries) / elapsed if elapsed > 0 else float("inf")
+    print(f"Summarized {len(summaries)} new articles ({nb_skipped} already cached) "
+          f"in {elapsed:.1f}s ({rate:.1f} articles/sec).")
+
+if __name__ == "__main__":
+    main()
@@ -182,6 +182,11 @@ def main():
         global_df_with_topics = pl.concat([global_df_with_topics, partial_df_with_topics], how="vertical")
         save_topic_model(topic_model, company)
 
+    # Carry forward the summaries computed by summaries_extraction.py so the news card keeps its abstracts
+    summaries_path = "./Data/News/news_summaries.parquet"
+    if os.path.exists(summaries_path):
+        global_df_with_topics = global_df_with_topics.join(pl.read_parquet(summaries_path), on="link", how="left")
+
     global_df_with_topics.write_parquet("./Data/News/news_with_topics.parquet")
 
 if __name__ == "__main__":